@@ -12,21 +12,28 @@ class Auxiliary:
     Represents an auxiliary variable in a system dynamics model.
 
     An auxiliary is a calculated value that depends on other variables in the system.
+
+    Every auxiliary exposes an ``inputs`` tuple naming the variables it depends on
+    (empty when not declared), so callers can read it without probing for the attribute.
     """
 
-    def __init__(self, name, calculation_function, unit=None):
+    def __init__(self, name, calculation_function, unit=None, inputs=None):
         """
         Initializes an Auxiliary object.
 
         :param name: The name of the auxiliary variable.
         :param calculation_function: Function that calculates the value of the auxiliary.
         :param unit: Unit of the calculated value (string or Quantity unit).
+        :param inputs: Names of the variables this auxiliary depends on, or a single name (optional).
         """
         if not callable(calculation_function):
             raise TypeError("calculation_function must be callable")
 
         self.name = name
         self.calculation_function = calculation_function
+        if isinstance(inputs, str):
+            inputs = (inputs,) # A single name, not a sequence of one-letter names
+        self.inputs = tuple(inputs) if inputs else ()
         self.value = None
 
         # Normalize unit
@@ -36,7 +43,7 @@ class Auxiliary:
             if unit.strip().lower() in {"1", "0", "dimensionless"}:
                 self.unit = ureg.dimensionless
             else:
-                self.unit = ureg.parse_expression(unit).units
+                self.unit = units.parse_unit(unit)
         else:
             self.unit = getattr(unit, "units", unit)
 
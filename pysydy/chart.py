@@ -33,7 +33,7 @@ class Chart:
         :rtype: tuple
         """
         # Get simulation results
-        results = self.simulation.get_results()
+        results = self.simulation.get_results_for_plot()
         
         # Check if there are any results to plot
         if results.empty:
@@ -79,7 +79,7 @@ class Chart:
         :rtype: tuple
         """
         # Get simulation results
-        results = self.simulation.get_results()
+        results = self.simulation.get_results_for_plot()
         
         # Check if there are any results to plot
         if results.empty:
@@ -127,7 +127,7 @@ class Chart:
         :rtype: tuple
         """
         # Get simulation results
-        results = self.simulation.get_results()
+        results = self.simulation.get_results_for_plot()
         
         # Check if there are any results to plot
         if results.empty:
@@ -172,7 +172,7 @@ class Chart:
         :rtype: tuple
         """
         # Get simulation results
-        results = self.simulation.get_results()
+        results = self.simulation.get_results_for_plot()
         
         # Check if there are any results to plot
         if results.empty:
@@ -222,7 +222,7 @@ class Chart:
         :rtype: tuple
         """
         # Get simulation results
-        results = self.simulation.get_results()
+        results = self.simulation.get_results_for_plot()
         
         # Check if there are any results to plot
         if results.empty:
@@ -276,7 +276,7 @@ class Chart:
         :rtype: tuple
         """
         # Get simulation results
-        results = self.simulation.get_results()
+        results = self.simulation.get_results_for_plot()
         
         # Check if there are any results to plot
         if results.empty:
@@ -320,7 +320,7 @@ class Chart:
         :rtype: tuple
         """
         # Get simulation results
-        results = self.simulation.get_results()
+        results = self.simulation.get_results_for_plot()
         
         # Check if there are any results to plot
         if results.empty:
@@ -372,7 +372,7 @@ class Chart:
         :rtype: matplotlib.figure.Figure
         """
         # Get simulation results
-        results = self.simulation.get_results()
+        results = self.simulation.get_results_for_plot()
         
         # Check if there are any results to plot
         if results.empty:
@@ -1,18 +1,44 @@
 """
 Defines the Flow class for PySyDy library.
 """
+import dis
+
 from units import units
 from pint import Quantity
 
 ureg = units.ureg
 Q_ = ureg.Quantity
 
+# Bytecode of a function whose body is just `return <constant>`
+_CONSTANT_RETURN_OPS = {'RESUME', 'LOAD_CONST', 'RETURN_VALUE', 'RETURN_CONST'}
+
+
+def _constant_return_value(function):
+    """
+    Returns the number a rate function always returns (e.g. `lambda state: 20`),
+    or None if its result may depend on anything.
+    """
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return None
+    instructions = list(dis.get_instructions(code))
+    if any(instruction.opname not in _CONSTANT_RETURN_OPS for instruction in instructions):
+        return None
+    values = [instruction.argval for instruction in instructions
+              if instruction.opname in ('LOAD_CONST', 'RETURN_CONST')]
+    if len(values) != 1 or isinstance(values[0], bool) or not isinstance(values[0], (int, float)):
+        return None
+    return values[0]
+
+
 class Flow:
     """
     Represents a flow in a system dynamics model.
     A flow is a rate variable that changes the level of stocks over time.
     """
 
+    __slots__ = ('name', 'source_stock', 'target_stock', 'rate_function', 'rate', 'unit', '_constant_rate')
+
     def __init__(self, name, source_stock, target_stock, rate_function, unit=None):
         """
         Initializes a Flow object.
@@ -37,10 +63,15 @@ class Flow:
             if unit.strip().lower() in {"1", "0", "dimensionless"}:
                 self.unit = ureg.dimensionless
             else:
-                self.unit = ureg.parse_expression(unit).units
+                self.unit = units.parse_unit(unit)
         else:
             self.unit = getattr(unit, "units", unit)
 
+        # Constant rate functions are evaluated once here instead of every step;
+        # keyed on the function so reassigning rate_function disables the shortcut
+        constant = _constant_return_value(rate_function)
+        self._constant_rate = None if constant is None else (rate_function, Q_(constant, self.unit))
+
         if source_stock:
             source_stock.add_outflow(self)
         if target_stock:
@@ -51,14 +82,20 @@ class Flow:
         Calculates the flow rate using the rate function.
         Wraps result in Quantity and checks dimensionality.
         """
+        constant = self._constant_rate
+        if constant is not None and constant[0] is self.rate_function:
+            self.rate = constant[1]
+            return self.rate
+
         raw = self.rate_function(system_state)
 
-        if isinstance(raw, Quantity):
-            self.rate = raw
-        else:
+        if not isinstance(raw, Quantity):
+            # Plain numbers are wrapped in the declared unit, so no dimensionality check is needed
             self.rate = Q_(raw, self.unit)
+            return self.rate
 
-        if self.unit and self.rate.dimensionality != self.unit.dimensionality:
+        self.rate = raw
+        if self.unit and raw.dimensionality != self.unit.dimensionality:
             raise ValueError(
                 f"[UNIT ERROR] Flow '{self.name}': returned {self.rate} "
                 f"but declared unit is '{self.unit}'"
@@ -3,6 +3,11 @@
 This module provides visualization capabilities for system dynamics models.
 """
 
+import hashlib
+import json
+import os
+import tempfile
+
 import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
@@ -12,6 +17,37 @@ from .auxiliary import Auxiliary
 from .parameter import Parameter
 from .simulation import Simulation
 
+# Node colors by type
+NODE_COLORS = {
+    'stock': '#3498db',      # Blue
+    'flow': '#e74c3c',       # Red
+    'auxiliary': '#2ecc71',  # Green
+    'parameter': '#f39c12'   # Orange
+}
+
+# Node shapes by type
+NODE_SHAPES = {
+    'stock': 's',      # Square
+    'flow': '^',       # Triangle
+    'auxiliary': 'o',  # Circle
+    'parameter': 'd'   # Diamond
+}
+
+# Node size multipliers by type, for better visual hierarchy
+NODE_SIZE_FACTORS = {
+    'stock': 1.2,      # Larger for stocks
+    'flow': 0.8,       # Medium for flows
+    'auxiliary': 0.7,  # Smaller for auxiliaries
+    'parameter': 0.9   # Medium-small for parameters
+}
+
+# Edge colors by type
+EDGE_COLORS = {
+    'outflow': '#e74c3c',  # Red
+    'inflow': '#e74c3c',   # Red
+    'influence': '#7f8c8d'  # Gray
+}
+
 class Graph:
     """
     Provides visualization capabilities for system dynamics models.
@@ -20,51 +56,65 @@ class Graph:
     showing the relationships between stocks, flows, auxiliaries, and parameters.
     """
     
-    def __init__(self, simulation):
+    def __init__(self, simulation, layout_cache_dir=None):
         """
         Initializes a Graph object.
         
         :param simulation: The simulation object containing the model components.
         :type simulation: Simulation
+        :param layout_cache_dir: Optional directory where computed node positions are saved,
+                                 keyed on the model structure, and reused by later sessions.
+        :type layout_cache_dir: str, optional
         """
         self.simulation = simulation
+        self.layout_cache_dir = layout_cache_dir
         self.graph = nx.DiGraph()
+        self._layout = None  # Cached by _get_layout()
+        self._layout_key = None
         self._build_graph()
         
     def _build_graph(self):
         """
         Builds the graph representation of the model.
         """
+        # Collect nodes and edges in one pass over the components, then add them in bulk
+        nodes = []
+        edges = []
+        
         # Add stocks as nodes
         for stock in self.simulation.stocks:
-            self.graph.add_node(stock.name, type='stock', obj=stock)
+            nodes.append((stock.name, {'type': 'stock', 'obj': stock}))
             
         # Add flows as nodes and edges
         for flow in self.simulation.flows:
-            self.graph.add_node(flow.name, type='flow', obj=flow)
+            nodes.append((flow.name, {'type': 'flow', 'obj': flow}))
             
             # Connect source stock to flow (if exists)
             if flow.source_stock:
-                self.graph.add_edge(flow.source_stock.name, flow.name, type='outflow')
+                edges.append((flow.source_stock.name, flow.name, {'type': 'outflow'}))
                 
             # Connect flow to target stock (if exists)
             if flow.target_stock:
-                self.graph.add_edge(flow.name, flow.target_stock.name, type='inflow')
+                edges.append((flow.name, flow.target_stock.name, {'type': 'inflow'}))
         
         # Add auxiliaries as nodes
         for aux in self.simulation.auxiliaries:
-            self.graph.add_node(aux.name, type='auxiliary', obj=aux)
-            
-            # Connect auxiliaries to their inputs (if specified)
-            if hasattr(aux, 'inputs') and aux.inputs:
-                for input_name in aux.inputs:
-                    # Check if input exists in the graph
-                    if input_name in self.graph:
-                        self.graph.add_edge(input_name, aux.name, type='influence')
+            nodes.append((aux.name, {'type': 'auxiliary', 'obj': aux}))
         
         # Add parameters as nodes
         for param in self.simulation.parameters:
-            self.graph.add_node(param.name, type='parameter', obj=param)
+            nodes.append((param.name, {'type': 'parameter', 'obj': param}))
+        
+        self.graph.add_nodes_from(nodes)
+        self.graph.add_edges_from(edges)
+        
+        # Connect auxiliaries to their inputs (if specified); inputs may name any
+        # component, so they are resolved once every node is in the graph
+        influence_edges = [(input_name, aux.name, {'type': 'influence'})
+                           for aux in self.simulation.auxiliaries
+                           for input_name in aux.inputs
+                           if input_name in self.graph]
+        self.graph.add_edges_from(influence_edges)
         
         # Connect parameters to flows based on rate function usage
         self._connect_parameters_to_flows()
@@ -86,46 +136,61 @@ class Graph:
             'recovery_rate': ['recovery']  # Keep for backward compatibility
         }
         
-        # Create edges based on the mapping
-        for param_name, flow_names in param_to_flow_map.items():
-            if param_name in [p.name for p in self.simulation.parameters]:
-                for flow_name in flow_names:
-                    if flow_name in [f.name for f in self.simulation.flows]:
-                        self.graph.add_edge(param_name, flow_name, type='influence')
+        # Create edges based on the mapping, adding them in one call
+        param_names = {p.name for p in self.simulation.parameters}
+        flow_names_in_model = {f.name for f in self.simulation.flows}
+        self.graph.add_edges_from(
+            (param_name, flow_name, {'type': 'influence'})
+            for param_name, flow_names in param_to_flow_map.items() if param_name in param_names
+            for flow_name in flow_names if flow_name in flow_names_in_model
+        )
     
-    def plot(self, figsize=(12, 8), node_size=2000, font_size=12, show_values=True):
+    def _get_layout(self):
         """
-        Plots the graph representation of the model.
+        Returns the nodes and edges grouped by type and the node positions.
         
-        :param figsize: The figure size (width, height) in inches.
-        :type figsize: tuple
-        :param node_size: The size of the nodes.
-        :type node_size: int
-        :param font_size: The font size for node labels.
-        :type font_size: int
-        :param show_values: Whether to show current values in the graph.
-        :type show_values: bool
-        :returns: The figure and axes objects.
+        The model structure is static, so these are computed once and reused by
+        later plots (keeping the layout stable across refreshes). They are
+        recomputed if nodes or edges have been added to the graph since.
+        
+        :returns: Nodes by type, edges by type and node positions.
         :rtype: tuple
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        layout_key = (self.graph.number_of_nodes(), self.graph.number_of_edges())
+        if self._layout is not None and self._layout_key == layout_key:
+            return self._layout
         
-        # Define node colors by type
-        color_map = {
-            'stock': '#3498db',      # Blue
-            'flow': '#e74c3c',       # Red
-            'auxiliary': '#2ecc71',  # Green
-            'parameter': '#f39c12'   # Orange
-        }
+        # Group nodes and edges by type in a single pass each
+        nodes_by_type = {node_type: [] for node_type in NODE_COLORS}
+        for n, node_type in self.graph.nodes(data='type'):
+            if node_type in nodes_by_type:
+                nodes_by_type[node_type].append(n)
+        edges_by_type = {edge_type: [] for edge_type in EDGE_COLORS}
+        for u, v, edge_type in self.graph.edges(data='type'):
+            if edge_type in edges_by_type:
+                edges_by_type[edge_type].append((u, v))
         
-        # Define node shapes by type
-        node_shapes = {
-            'stock': 's',      # Square
-            'flow': '^',       # Triangle
-            'auxiliary': 'o',  # Circle
-            'parameter': 'd'   # Diamond
-        }
+        # Reuse positions saved for this exact structure, if a cache directory is set
+        layout_path = self._layout_cache_path() if self.layout_cache_dir else None
+        pos = self._load_positions(layout_path) if layout_path else None
+        if pos is None:
+            pos = self._compute_positions(nodes_by_type['parameter'])
+            if layout_path:
+                self._save_positions(layout_path, pos)
         
+        self._layout = (nodes_by_type, edges_by_type, pos)
+        self._layout_key = layout_key
+        return self._layout
+    
+    def _compute_positions(self, param_nodes):
+        """
+        Computes a spring layout for the graph, spread out for readability.
+        
+        :param param_nodes: The parameter nodes, which are moved away from their neighbors.
+        :type param_nodes: list
+        :returns: Node positions keyed by node name.
+        :rtype: dict
+        """
         # Create improved position layout with more spacing
         pos = nx.spring_layout(self.graph, k=1.5, iterations=100)  # Use spring layout with more spacing
         
@@ -135,8 +200,6 @@ class Graph:
             pos[node] = (pos[node][0] * 2.0, pos[node][1] * 2.0)
             
         # Further adjust parameter positions to prevent overlapping
-        param_nodes = [n for n, data in self.graph.nodes(data=True) if data.get('type') == 'parameter']
-        
         # Spread parameters more evenly around their connected flows
         for param in param_nodes:
             neighbors = list(self.graph.successors(param))
@@ -159,45 +222,87 @@ class Graph:
                 # Update parameter position
                 pos[param] = (avg_x + vector_x, avg_y + vector_y)
         
-        # Define node sizes by type for better visual hierarchy
-        node_sizes = {
-            'stock': node_size * 1.2,      # Larger for stocks
-            'flow': node_size * 0.8,       # Medium for flows
-            'auxiliary': node_size * 0.7,  # Smaller for auxiliaries
-            'parameter': node_size * 0.9   # Medium-small for parameters
-        }
+        return pos
+    
+    def _layout_cache_path(self):
+        """
+        Returns the layout cache file for the current graph structure.
+        """
+        topology = repr(sorted(self.graph.nodes())) + repr(sorted(self.graph.edges()))
+        topology_hash = hashlib.md5(topology.encode(), usedforsecurity=False).hexdigest()
+        return os.path.join(self.layout_cache_dir, f"layout_{topology_hash}.json")
+    
+    def _load_positions(self, path):
+        """
+        Loads saved node positions, or returns None if there are none usable.
+        """
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if set(saved) != set(self.graph.nodes()):
+            return None
+        return {node: tuple(xy) for node, xy in saved.items()}
+    
+    def _save_positions(self, path, pos):
+        """
+        Saves node positions so later sessions can skip the layout computation.
+        The cache is optional, so if it can't be written it is silently skipped.
+        The file is written under a temporary name and then moved into place, so a
+        failed write never leaves a truncated cache file behind.
+        """
+        tmp_path = None
+        try:
+            os.makedirs(self.layout_cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.layout_cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({node: [float(x), float(y)] for node, (x, y) in pos.items()}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def plot(self, figsize=(12, 8), node_size=2000, font_size=12, show_values=True):
+        """
+        Plots the graph representation of the model.
+        
+        :param figsize: The figure size (width, height) in inches.
+        :type figsize: tuple
+        :param node_size: The size of the nodes.
+        :type node_size: int
+        :param font_size: The font size for node labels.
+        :type font_size: int
+        :param show_values: Whether to show current values in the graph.
+        :type show_values: bool
+        :returns: The figure and axes objects.
+        :rtype: tuple
+        """
+        fig, ax = plt.subplots(figsize=figsize)
+        
+        nodes_by_type, edges_by_type, pos = self._get_layout()
         
         # Draw nodes by type with improved appearance
-        for node_type in ['stock', 'flow', 'auxiliary', 'parameter']:
-            nodes = [n for n, data in self.graph.nodes(data=True) if data.get('type') == node_type]
+        for node_type, nodes in nodes_by_type.items():
             nx.draw_networkx_nodes(
                 self.graph, pos,
                 nodelist=nodes,
-                node_color=color_map[node_type],
-                node_shape=node_shapes[node_type],
-                node_size=node_sizes[node_type],
+                node_color=NODE_COLORS[node_type],
+                node_shape=NODE_SHAPES[node_type],
+                node_size=node_size * NODE_SIZE_FACTORS[node_type],
                 alpha=0.9,
                 edgecolors='black',  # Add black outline
                 linewidths=1.5,      # Outline width
                 ax=ax
             )
         
-        # Draw edges with different colors based on type
-        edge_colors = {
-            'outflow': '#e74c3c',  # Red
-            'inflow': '#e74c3c',   # Red
-            'influence': '#7f8c8d'  # Gray
-        }
-        
-        # Draw edges by type
-        for edge_type, color in edge_colors.items():
-            edges = [(u, v) for u, v, data in self.graph.edges(data=True) 
-                    if data.get('type') == edge_type]
+        # Draw edges by type with different colors
+        for edge_type, edges in edges_by_type.items():
             nx.draw_networkx_edges(
                 self.graph, pos,
                 edgelist=edges,
                 width=2, alpha=0.8,
-                edge_color=color,
+                edge_color=EDGE_COLORS[edge_type],
                 arrows=True,
                 arrowsize=25,
                 connectionstyle='arc3,rad=0.1',  # Curved edges
@@ -212,15 +317,7 @@ class Graph:
                 if hasattr(obj, 'get_value'):
                     value = obj.get_value()
                     if isinstance(value, (int, float)):
-                        # Format numbers with appropriate precision
-                        if value >= 1000:
-                            labels[node] = f"{node}\n{value:.2f}"
-                        elif value >= 100:
-                            labels[node] = f"{node}\n{value:.2f}"
-                        elif value >= 10:
-                            labels[node] = f"{node}\n{value:.2f}"
-                        else:
-                            labels[node] = f"{node}\n{value:.2f}"
+                        labels[node] = f"{node}\n{value:.2f}"
                     else:
                         labels[node] = f"{node}\n{value}"
                 else:
@@ -242,10 +339,10 @@ class Graph:
         
         # Create legend
         legend_elements = [
-            Patch(facecolor=color_map['stock'], edgecolor='k', label='Stock'),
-            Patch(facecolor=color_map['flow'], edgecolor='k', label='Flow'),
-            Patch(facecolor=color_map['auxiliary'], edgecolor='k', label='Auxiliary'),
-            Patch(facecolor=color_map['parameter'], edgecolor='k', label='Parameter')
+            Patch(facecolor=NODE_COLORS['stock'], edgecolor='k', label='Stock'),
+            Patch(facecolor=NODE_COLORS['flow'], edgecolor='k', label='Flow'),
+            Patch(facecolor=NODE_COLORS['auxiliary'], edgecolor='k', label='Auxiliary'),
+            Patch(facecolor=NODE_COLORS['parameter'], edgecolor='k', label='Parameter')
         ]
         ax.legend(handles=legend_elements, loc='upper right')
         
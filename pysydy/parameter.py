@@ -32,7 +32,7 @@ class Parameter:
             if unit.strip().lower() in {"1", "dimensionless"}:
                 self.unit = ureg.dimensionless
             else:
-                self.unit = ureg.parse_expression(unit).units
+                self.unit = units.parse_unit(unit)
         else:
             self.unit = getattr(unit, "units", unit)
 
@@ -1,67 +1,329 @@
+import copy
+import heapq
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+
+import numpy as np
 import pandas as pd
+import pint
 from units import units
 from tqdm import trange # for a progress live bar
 
 ureg = units.ureg
 Q_ = ureg.Quantity
+_DAY_DIM = ureg.day.dimensionality
+
+# C-level getters used to read component values when recording history
+_get_value = attrgetter('value')
+_get_rate = attrgetter('rate')
+
+
+# The model a run_sweep worker process runs its cases on, set by _init_sweep_worker
+_sweep_simulation = None
+
+
+def _init_sweep_worker(pickled_simulation):
+    """
+    Sets up a run_sweep worker process: makes pint rebuild pickled quantities in this
+    package's registry (so custom units resolve), then unpickles the model once.
+    The model arrives pickled so it is only unpickled after the registry is set.
+    """
+    global _sweep_simulation
+    pint.set_application_registry(ureg)
+    _sweep_simulation = pickle.loads(pickled_simulation)
+
+
+def _run_sweep_worker_case(parameter_values, duration):
+    """
+    Runs one sweep case on the worker's model.
+    """
+    return _sweep_simulation._run_sweep_case(parameter_values, duration)
+
+
+def _offset_value(value, delta):
+    """
+    Returns `value + delta`, where delta is a float in the value's unit (if it has one).
+    """
+    if isinstance(value, Q_):
+        return Q_(value.magnitude + delta, value.units)
+    return value + delta
+
+
+def _references_any(function, objects):
+    """
+    Returns True if `function` reads any of `objects` (by identity) from its closure
+    or its module globals, rather than through the state dict it is given.
+    """
+    code = getattr(function, '__code__', None)
+    if code is None:
+        return False
+    ids = {id(obj) for obj in objects}
+    for cell in getattr(function, '__closure__', None) or ():
+        try:
+            if id(cell.cell_contents) in ids:
+                return True
+        except ValueError: # Empty cell
+            continue
+    function_globals = getattr(function, '__globals__', {})
+    return any(id(function_globals.get(name)) in ids for name in code.co_names if name in function_globals)
+
+class _ComponentIndex(dict):
+    """
+    Maps component names to components for `state['all']`, remembering the names
+    that several components share so looking one up explains why it is missing.
+    """
+
+    def __init__(self, components, ambiguous):
+        super().__init__(components)
+        self.ambiguous = ambiguous
+
+    def __missing__(self, name):
+        if name in self.ambiguous:
+            raise KeyError(f"'{name}' names more than one component; use the group dicts "
+                           f"(state['stocks'], state['flows'], ...) instead of state['all'].")
+        raise KeyError(name)
+
 
 class Simulation:
     """
     Manages the simulation of a system dynamics model, handling time stepping,
     calculation order, and data collection.
+
+    Units are checked when the model is first run (or by calling validate_model()),
+    not at construction.
     """
-    def __init__(self, stocks, flows, auxiliaries, parameters, timestep=1.0, timestep_unit='day'):
+    INTEGRATION_METHODS = ('euler', 'rk4')
+
+    def __init__(self, stocks, flows, auxiliaries, parameters, timestep=1.0, timestep_unit='day', verbose=True,
+                 method='euler'):
+        if method not in self.INTEGRATION_METHODS:
+            raise ValueError(f"Unknown integration method '{method}'; expected one of {self.INTEGRATION_METHODS}.")
         self.stocks = stocks
         self.flows = flows
         self.auxiliaries = auxiliaries
         self.parameters = parameters
         self.timestep = units.get_quantity(timestep, timestep_unit)  # ⬅️ now flexible
-        self.time = 0.0 * units.ureg(timestep_unit)
+        # Time is tracked as a step count from a float origin in the timestep unit;
+        # see the `time` property
+        self._timestep_mag = self.timestep.magnitude
+        self._time_units = self.timestep.units
+        self._timestep_units_str = str(self._time_units)
+        self._timestep_dim = self.timestep.dimensionality
+        self._time_origin = 0.0
+        self._step_count = 0
+        self._time_mag = 0.0
         self.history = []
         self.loops = [] # Add list to store feedback loops
+        self.verbose = verbose # Print validation progress and show the progress bar in run()
+        self._validated = False # Set once validate_model() passes; later runs skip it
+        self.method = method # 'euler' (one evaluation per step) or 'rk4' (fourth-order Runge-Kutta)
+        self._influences_current = False # True when auxiliaries/flows already match the current stocks
+        self._structure_key = None
+        self._history_columns = None
+        self._sync_structure()
+        self._history_version = 0 # Bumped on every recorded row; keys the results cache
+        self._results_cache = {}
+        # Unit checks are deferred to validate_model(), which the first run() calls
+
+    @property
+    def time(self):
+        """
+        Returns the current simulation time as a Quantity in the timestep unit.
+        """
+        return Q_(self._time_mag, self._time_units)
 
-        self.check_units()
+    @time.setter
+    def time(self, value):
+        self._time_origin = units.force_quantity(value, str(self._time_units)).m_as(self._time_units)
+        self._step_count = 0
+        self._time_mag = self._time_origin
 
     def step(self):
         """
         Advance the simulation by one timestep.
         """
 
-        # 1. Calculate auxiliaries
-        for aux in self.auxiliaries:
-            aux.calculate_value(self._get_system_state())
-
-        # 2. Calculate flow rates
-        for flow in self.flows:
-            flow.calculate_rate(self._get_system_state())
+        # 1-2. Calculate auxiliaries and flow rates (skipped if run() just validated them)
+        if self._influences_current:
+            self._influences_current = False
+        else:
+            self._calculate_influences(self._get_system_state())
 
         # 3. Update stocks
-        for stock in self.stocks:
-            stock.update(self.timestep)
+        if self.method == 'rk4':
+            self._update_stocks_rk4()
+        else:
+            for stock in self.stocks:
+                stock.update(self.timestep)
 
         # 4. Record state
         self._record_state()
-        self.time += self.timestep
+        # Multiply rather than accumulate, so long runs don't drift from k * timestep
+        self._step_count += 1
+        self._time_mag = self._time_origin + self._step_count * self._timestep_mag
 
-    def _get_system_state(self):
+    def _update_stocks_rk4(self):
         """
-        Returns a dictionary representing the current system state.
+        Advances all stocks by one timestep with the classic fourth-order Runge-Kutta scheme.
+
+        Expects auxiliaries and flows to be calculated for the current stocks. Their
+        values and the simulation time are restored afterwards, so the recorded state
+        matches Euler's: the flows and auxiliaries at the start of the step.
+        """
+        dt = self._timestep_mag
+        start_time = self._time_mag
+        start_values = [stock.value for stock in self.stocks]
+        start_influences = ([(aux, aux.value) for aux in self.auxiliaries],
+                            [(flow, flow.rate) for flow in self.flows])
+
+        k1 = self._stock_derivatives()
+        k2 = self._stock_derivatives_at(start_values, k1, dt / 2)
+        k3 = self._stock_derivatives_at(start_values, k2, dt / 2)
+        k4 = self._stock_derivatives_at(start_values, k3, dt)
+        self._time_mag = start_time
+
+        for stock, start, d1, d2, d3, d4 in zip(self.stocks, start_values, k1, k2, k3, k4):
+            stock.value = _offset_value(start, dt / 6 * (d1 + 2 * d2 + 2 * d3 + d4))
+
+        aux_values, flow_rates = start_influences
+        for aux, value in aux_values:
+            aux.value = value
+        for flow, rate in flow_rates:
+            flow.rate = rate
+
+    def _stock_derivatives(self):
+        """
+        Returns each stock's net flow per timestep unit, from the current flow rates.
+        """
+        return [stock._net_flow_magnitude(self.timestep) for stock in self.stocks]
+
+    def _stock_derivatives_at(self, start_values, slopes, h):
+        """
+        Moves the stocks to `start + h * slope` and the time to `step start + h`,
+        recalculates auxiliaries and flows there, and returns the stock derivatives
+        at that point.
+        """
+        for stock, start, slope in zip(self.stocks, start_values, slopes):
+            stock.value = _offset_value(start, h * slope)
+        self._time_mag = self._time_origin + self._step_count * self._timestep_mag + h
+        self._calculate_influences(self._get_system_state())
+        return self._stock_derivatives()
+
+    def _calculate_influences(self, system_state):
+        """
+        Recalculates all auxiliaries, then all flow rates, from the given system state.
         """
-        return {
+        for aux in self._sorted_auxiliaries:
+            aux.calculate_value(system_state)
+
+        for flow in self.flows:
+            flow.calculate_rate(system_state)
+
+    def _sync_structure(self):
+        """
+        Rebuilds the caches derived from the component lists (calculation order,
+        history columns and the system state dict) if components were added, removed
+        or replaced since they were last built. Existing history rows are remapped
+        to the new columns by name, with None for components they did not record.
+        """
+        key = tuple(tuple(map(id, group)) for group in
+                    (self.stocks, self.flows, self.auxiliaries, self.parameters))
+        if key == self._structure_key:
+            return
+
+        self._sorted_auxiliaries = self._get_auxiliary_calculation_order()
+        old_columns = self._history_columns
+        self._history_columns = (['time'] + [s.name for s in self.stocks] + [f.name for f in self.flows]
+                                 + [a.name for a in self.auxiliaries])
+        if self.history and old_columns is not None and old_columns != self._history_columns:
+            old_positions = {}
+            for i, name in enumerate(old_columns):
+                old_positions.setdefault(name, i)
+            positions = [old_positions.get(name) for name in self._history_columns]
+            self.history = [tuple(None if i is None else row[i] for i in positions) for row in self.history]
+
+        self._system_state = {
             'stocks': {s.name: s for s in self.stocks},
             'flows': {f.name: f for f in self.flows},
             'auxiliaries': {a.name: a for a in self.auxiliaries},
             'parameters': {p.name: p for p in self.parameters},
         }
+        # Flat view over every component by name, for single-lookup access in user functions.
+        # Names used by more than one component are left out rather than letting one shadow
+        # the others; looking them up raises a KeyError that says so
+        components_by_name = {}
+        for group in (self.stocks, self.flows, self.auxiliaries, self.parameters):
+            for component in group:
+                components_by_name.setdefault(component.name, []).append(component)
+        self._system_state['all'] = _ComponentIndex(
+            {name: found[0] for name, found in components_by_name.items() if len(found) == 1},
+            ambiguous={name for name, found in components_by_name.items() if len(found) > 1})
+
+        self._structure_key = key
+        self._validated = False # New components need their units checked
+        self._influences_current = False
+
+    def _get_auxiliary_calculation_order(self):
+        """
+        Orders the auxiliaries so each one is calculated after the auxiliaries
+        named in its `inputs` (Kahn's algorithm). Inputs that are not auxiliaries
+        are ignored. Ties are broken by declaration order, so the result is the
+        same on every run and matches the user's order when no inputs are given.
+
+        :returns: The auxiliary objects in calculation order.
+        :rtype: list
+        :raises ValueError: If the declared inputs form a cycle.
+        """
+        # The graph is built over positions, so auxiliaries sharing a name are all kept
+        auxiliaries = self.auxiliaries
+        positions_by_name = {}
+        for i, aux in enumerate(auxiliaries):
+            positions_by_name.setdefault(aux.name, []).append(i)
+        in_degree = [0] * len(auxiliaries)
+        successors = [[] for _ in auxiliaries]
+        for i, aux in enumerate(auxiliaries):
+            for input_name in aux.inputs:
+                for j in positions_by_name.get(input_name, ()):
+                    successors[j].append(i)
+                    in_degree[i] += 1
+
+        # Positions double as declaration order for breaking ties
+        ready = [i for i, degree in enumerate(in_degree) if degree == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(auxiliaries[i])
+            for successor in successors[i]:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    heapq.heappush(ready, successor)
+
+        if len(order) < len(auxiliaries):
+            cyclic = [auxiliaries[i].name for i, degree in enumerate(in_degree) if degree > 0]
+            raise ValueError(f"Auxiliaries {cyclic} depend on each other in a cycle; check their inputs.")
+        return order
+
+    def _get_system_state(self):
+        """
+        Returns a dictionary representing the current system state.
+
+        The dictionary maps names to the component objects themselves, so it is
+        built once and stays current as their values change. Besides the
+        'stocks', 'flows', 'auxiliaries' and 'parameters' groups, 'all' maps
+        every component name to its object.
+        """
+        return self._system_state
 
     def _record_state(self):
-        state = {
-            'time': self.time,
-            'stocks': {s.name: s.value for s in self.stocks},
-            'flows': {f.name: f.rate for f in self.flows},
-            'auxiliaries': {a.name: a.value for a in self.auxiliaries},
-        }
-        self.history.append(state)
+        """
+        Appends the current values as one tuple, ordered like `_history_columns`.
+        """
+        self.history.append((self._time_mag, *map(_get_value, self.stocks), *map(_get_rate, self.flows),
+                             *map(_get_value, self.auxiliaries)))
+        self._history_version += 1
 
 
 
@@ -69,38 +331,39 @@ class Simulation:
         """
         Returns a DataFrame with the simulation results.
         """
-        # Create a DataFrame from the history list
-        df = pd.DataFrame(self.history)
-        
-        # Extract nested dictionaries into columns
-        # First, create a copy of the DataFrame to avoid modifying during iteration
-        result_df = df[['time']].copy()
-        
-        # Process stocks
-        if 'stocks' in df.columns:
-            for idx, record in enumerate(df['stocks']):
-                for stock_name, stock_value in record.items():
-                    if stock_name not in result_df.columns:
-                        result_df[stock_name] = None
-                    result_df.loc[idx, stock_name] = stock_value
-        
-        # Process flows
-        if 'flows' in df.columns:
-            for idx, record in enumerate(df['flows']):
-                for flow_name, flow_value in record.items():
-                    if flow_name not in result_df.columns:
-                        result_df[flow_name] = None
-                    result_df.loc[idx, flow_name] = flow_value
-        
-        # Process auxiliaries
-        if 'auxiliaries' in df.columns:
-            for idx, record in enumerate(df['auxiliaries']):
-                for aux_name, aux_value in record.items():
-                    if aux_name not in result_df.columns:
-                        result_df[aux_name] = None
-                    result_df.loc[idx, aux_name] = aux_value
-        
-        return result_df.set_index('time')
+        return self._cached_results('results', self._build_results)
+
+    def _build_results(self):
+        results = self._history_frame()
+
+        # Times are recorded as plain magnitudes; reattach the timestep unit here
+        results.index = pd.Index([Q_(t, self._time_units) for t in results.index], name='time')
+        return results
+
+    def _cached_results(self, key, build):
+        """
+        Returns a copy of the frame produced by `build`, rebuilding it only when
+        the history has changed since it was last cached under `key`.
+        """
+        # `history` is public, so also key on the list itself and its length to catch
+        # callers replacing, clearing or extending it directly
+        history = self.history
+        cached = self._results_cache.get(key)
+        if (cached is None or cached[0] != self._history_version
+                or cached[1] is not history or cached[2] != len(history)):
+            frame = build()
+            self._results_cache[key] = (self._history_version, history, len(history), frame)
+        else:
+            frame = cached[3]
+        # Hand out a copy so callers can modify it without corrupting the cache
+        return frame.copy()
+
+    def _history_frame(self):
+        """
+        Returns the history as a DataFrame indexed by the plain time magnitudes.
+        """
+        # History rows are already flat, so the frame is built in one pass
+        return pd.DataFrame.from_records(self.history, columns=self._history_columns).set_index('time')
 
     def check_units(self):
         """
@@ -126,8 +389,10 @@ class Simulation:
                 # Assume flows should match stock unit/time
                 # You could check source_stock or target_stock more strictly later
                 if flow.source_stock and flow.source_stock.unit:
-                    expected_flow_unit = flow.source_stock.unit / units.ureg.day  # assuming timestep in day
-                    if not flow.unit.dimensionality == expected_flow_unit.dimensionality:
+                    # Compare dimensionalities directly; the unit is only built for the message
+                    expected_dim = flow.source_stock.unit.dimensionality / _DAY_DIM  # assuming timestep in day
+                    if not flow.unit.dimensionality == expected_dim:
+                        expected_flow_unit = flow.source_stock.unit / units.ureg.day
                         errors.append(
                             f"Flow '{flow.name}' unit {flow.unit} incompatible with source stock '{flow.source_stock.name}' unit/time ({expected_flow_unit})."
                         )
@@ -151,28 +416,28 @@ class Simulation:
         Run all flow and auxiliary functions once to ensure they return values with correct dimensionality.
         """
 
-        system_state = self._get_system_state()
+        try:
+            self._calculate_influences(self._get_system_state())
+        except Exception as e:
+            print(str(e))
+            raise
 
-        for aux in self.auxiliaries:
-            try:
-                aux.calculate_value(system_state)
-            except Exception as e:
-                print(str(e))
-                raise
-
-        for flow in self.flows:
-            try:
-                flow.calculate_rate(system_state)
-            except Exception as e:
-                print(str(e))
-                raise
-
-    def validate_model(self):
+    def validate_model(self, force=False):
         """
         Runs all unit checks: structure and expression correctness.
         Combines check_units() and validate_influences().
+
+        The checks run once per simulation; later calls return immediately.
+
+        :param force: Re-run the checks even if the model was already validated
+                      (e.g. after changing units or functions of its components).
         """
-        print("[UNIT CHECK] Running structural and functional unit checks...")
+        self._sync_structure()
+        if self._validated and not force:
+            return
+
+        if self.verbose:
+            print("[UNIT CHECK] Running structural and functional unit checks...")
 
         # 1. Structural: check if units are defined and flow/stock compatibility
         self.check_units()
@@ -180,7 +445,9 @@ class Simulation:
         # 2. Functional: check calculated values from flows and auxiliaries
         self.validate_influences()
 
-        print("[UNIT CHECK] All units are dimensionally consistent.")
+        if self.verbose:
+            print("[UNIT CHECK] All units are dimensionally consistent.")
+        self._validated = True
 
     def run(self, duration):
         """
@@ -190,27 +457,124 @@ class Simulation:
         Raises a warning if dimensionality mismatch is detected.
         """
 
+        # A first validation evaluates every auxiliary and flow against the current stocks
+        self._sync_structure()
+        influences_current = not self._validated
         self.validate_model()
 
-        if not hasattr(duration, 'units'):
-            duration_quantity = units.get_quantity(duration, str(self.timestep.units))
+        # Plain numbers are already in the timestep unit; only Quantities need checking
+        if hasattr(duration, 'units'):
+            # Smart dimensionality check
+            if not duration.dimensionality == self._timestep_dim:
+                raise ValueError(
+                    f"[UNIT ERROR] Duration unit {duration.units} is incompatible with timestep unit {self._timestep_units_str}."
+                )
+            duration_mag = duration.m_as(self._time_units)
         else:
-            duration_quantity = duration
-
-        # Smart dimensionality check
-        if not duration_quantity.dimensionality == self.timestep.dimensionality:
-            raise ValueError(
-                f"[UNIT ERROR] Duration unit {duration_quantity.units} is incompatible with timestep unit {self.timestep.units}."
-            )
+            duration_mag = duration
 
         # Safe division
-        steps = int((duration_quantity / self.timestep).to_base_units().magnitude)
-        for _ in range(steps):
-            self.step()
+        steps = int(duration_mag / self._timestep_mag)
 
-        for _ in trange(steps, desc="Running simulation"):
+        # If validate_model() has just evaluated the influences, the first step can reuse them.
+        # Without steps, leave the flag clear: callers may change inputs before a later step()
+        self._influences_current = influences_current and steps > 0
+        for _ in trange(steps, desc="Running simulation", disable=not self.verbose):
             self.step()
 
+    def run_sweep(self, parameter_sets, duration, n_jobs=1):
+        """
+        Runs the model once per parameter set and returns the results of each run.
+
+        Every run starts from the initial stock values at time 0 with an empty history.
+        The simulation's own state (values, time, history and parameter values) is
+        restored afterwards.
+
+        :param parameter_sets: Iterable of dicts mapping parameter names to values
+                               (numbers are interpreted in the parameter's unit).
+        :param duration: Duration of each run, as accepted by run().
+        :param n_jobs: Number of worker processes; None or a value <= 0 uses all CPUs.
+                       With more than one, the model is pickled, so rate and calculation
+                       functions must be module-level functions that read components
+                       only through the state dict (a ValueError is raised otherwise).
+        :returns: List of result DataFrames, in the order of `parameter_sets`.
+        :rtype: list
+        """
+        parameter_sets = list(parameter_sets)
+        if n_jobs is None or n_jobs <= 0:
+            n_jobs = os.cpu_count() or 1
+        if n_jobs == 1 or len(parameter_sets) <= 1:
+            return [self._run_sweep_case(values, duration) for values in parameter_sets]
+
+        # Worker copies of functions that hold components directly would read the
+        # unpickled originals, not the worker's model, and silently ignore the overrides
+        components = [self, *self.stocks, *self.flows, *self.auxiliaries, *self.parameters]
+        functions = [flow.rate_function for flow in self.flows] + \
+                    [aux.calculation_function for aux in self.auxiliaries]
+        for function in functions:
+            if _references_any(function, components):
+                raise ValueError(
+                    f"[SWEEP ERROR] Function {getattr(function, '__name__', function)!r} reads model "
+                    f"components directly instead of through the state dict; use n_jobs=1."
+                )
+
+        # Results come back as pickled Quantities, which pint rebuilds in its application
+        # registry; point it at ours only while collecting them
+        # Send the model to each worker once, without the history and cached results
+        # that a case does not need
+        template = copy.copy(self)
+        template.history = []
+        template._results_cache = {}
+        pickled_simulation = pickle.dumps(template)
+
+        previous_registry = pint.application_registry.get()
+        pint.set_application_registry(ureg)
+        try:
+            with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_sweep_worker,
+                                     initargs=(pickled_simulation,)) as executor:
+                futures = [executor.submit(_run_sweep_worker_case, values, duration) for values in parameter_sets]
+                return [future.result() for future in futures]
+        finally:
+            pint.set_application_registry(previous_registry)
+
+    def _run_sweep_case(self, parameter_values, duration):
+        """
+        Runs one parameter set of a sweep in place from the initial state and returns
+        its results, then restores the simulation's state and parameter values.
+        """
+        parameters = {parameter.name: parameter for parameter in self.parameters}
+        for name in parameter_values:
+            if name not in parameters:
+                raise ValueError(f"[SWEEP ERROR] Unknown parameter '{name}'.")
+
+        saved_values = [(component, component.value)
+                        for component in (*self.stocks, *self.auxiliaries, *self.parameters)]
+        saved_rates = [(flow, flow.rate) for flow in self.flows]
+        saved_attributes = {name: getattr(self, name) for name in (
+            'history', '_time_origin', '_step_count', '_time_mag',
+            '_influences_current', '_validated', 'verbose')}
+        try:
+            for name, value in parameter_values.items():
+                parameter = parameters[name]
+                parameter.value = value if isinstance(value, Q_) else Q_(value, parameter.unit)
+            for stock in self.stocks:
+                stock.value = stock.initial_value
+            self.history = []
+            self.time = 0.0
+            self._influences_current = False
+            self._validated = False # Overrides may change units, so check them again
+            self.verbose = False
+            self.run(duration)
+            return self.get_results()
+        finally:
+            for component, value in saved_values:
+                component.value = value
+            for flow, rate in saved_rates:
+                flow.rate = rate
+            for name, value in saved_attributes.items():
+                setattr(self, name, value)
+            self._history_version += 1 # Drop results cached from the sweep's history
+
     def add_loop(self, loop):
         """
         Adds a feedback loop object (for documentation/analysis).
@@ -235,16 +599,19 @@ class Simulation:
         - Converts time index from Quantity to float
         - Converts all stock/flow/auxiliary values from Quantity to float
         """
-        results = self.get_results().copy()
+        return self._cached_results('results_for_plot', self._build_results_for_plot)
 
-        # Fix the time index
-        if hasattr(results.index[0], 'magnitude'):
-            results.index = results.index.to_series().apply(lambda t: t.magnitude)
+    def _build_results_for_plot(self):
+        # The history already holds the time as a float, so only the values need converting
+        results = self._history_frame()
 
-        # Fix values inside columns
+        # Fix values inside columns with one pass over each column's raw values
+        # (None marks rows recorded before a component was added; it becomes NaN)
         for col in results.columns:
-            if hasattr(results[col].iloc[0], 'magnitude'):
-                results[col] = results[col].apply(lambda x: x.magnitude)
+            values = results[col].values
+            if values.dtype == object and any(hasattr(x, 'magnitude') for x in values):
+                results[col] = np.fromiter((np.nan if x is None else getattr(x, 'magnitude', x) for x in values),
+                                           dtype=float, count=len(values))
 
         return results
 
@@ -254,21 +621,15 @@ class Simulation:
         """
         import matplotlib.pyplot as plt
 
-        results = self.get_results().copy()
-        time_unit = str(self.timestep.units)
-
-        # Convert time index to pure floats
-        if hasattr(results.index[0], 'magnitude'):
-            results.index = results.index.to_series().apply(lambda t: t.magnitude)
+        # Time index and values are already plain floats (and cached across calls)
+        results = self.get_results_for_plot()
+        time_unit = self._timestep_units_str
 
         # Plot each stock individually
         for stock in self.stocks:
             if stock.name in results.columns:
-                # Get pure numerical values
-                stock_values = results[stock.name].apply(lambda x: x.magnitude if hasattr(x, 'magnitude') else x)
-
                 plt.figure(figsize=(8, 5))
-                plt.plot(results.index, stock_values)
+                plt.plot(results.index, results[stock.name])
                 plt.title(f"{stock.name} Over Time")
                 plt.xlabel(f"Time [{time_unit}]")
                 ylabel = f"{stock.name} [{str(stock.unit)}]" if stock.unit else f"{stock.name} [no unit]"
@@ -14,6 +14,9 @@ class Stock:
     due to flows.
     """
 
+    __slots__ = ('name', 'unit', 'initial_value', 'value', 'inflows', 'outflows', '_inflow_set', '_outflow_set',
+                 '_rate_factors')
+
     def __init__(self, name, initial_value=0.0, unit = None):
         """
                Initializes a Stock object.
@@ -31,7 +34,7 @@ class Stock:
             if unit.strip().lower() in {"1", "dimensionless"}:
                 self.unit = ureg.dimensionless
             else:
-                self.unit = ureg.parse_expression(unit).units
+                self.unit = units.parse_unit(unit)
         else:
             self.unit = getattr(unit, "units", unit)
 
@@ -44,38 +47,93 @@ class Stock:
         self.value = self.initial_value
         self.inflows = []
         self.outflows = []
+        # Membership sets so a flow registered twice (e.g. by Flow and by hand) counts once
+        self._inflow_set = set()
+        self._outflow_set = set()
+        self._rate_factors = {}  # Cached (rate unit, timestep unit, value unit) -> conversion factor
 
     def add_inflow(self, flow):
         """
-        Adds an inflow to the stock.
+        Adds an inflow to the stock. Adding the same flow again has no effect.
 
         :param flow: The flow object to add as an inflow.
         :type flow: Flow
         """
-        self.inflows.append(flow)
+        if flow not in self._inflow_set:
+            self._inflow_set.add(flow)
+            self.inflows.append(flow)
 
     def add_outflow(self, flow):
         """
-        Adds an outflow to the stock.
+        Adds an outflow to the stock. Adding the same flow again has no effect.
 
         :param flow: The flow object to add as an outflow.
         :type flow: Flow
         """
-        self.outflows.append(flow)
+        if flow not in self._outflow_set:
+            self._outflow_set.add(flow)
+            self.outflows.append(flow)
 
     def update(self, timestep):
         """
         Updates the stock's value based on its inflows and outflows.
 
+        Rates are summed as plain floats in the stock's unit per timestep unit,
+        so pint only converts units the first time a combination is seen.
+
         :param timestep: The time interval for the update.
         :type timestep: float
         """
+        if not (isinstance(self.value, Q_) and isinstance(timestep, Q_)):
+            # Without units on both sides there is nothing to convert; use plain arithmetic
+            net_flow = 0.0
+            for inflow in self.inflows:
+                net_flow += inflow.rate
+            for outflow in self.outflows:
+                net_flow -= outflow.rate
+            self.value += net_flow * timestep
+            return
+
+        net_flow = self._net_flow_magnitude(timestep)
+        self.value = Q_(self.value.magnitude + net_flow * timestep.magnitude, self.value.units)
+
+    def _net_flow_magnitude(self, timestep):
+        """
+        Returns the net flow (inflows minus outflows) as a float in the stock's
+        unit per timestep unit.
+
+        :param timestep: The time interval of the update (a Quantity).
+        :returns: The net flow magnitude.
+        :rtype: float
+        """
         net_flow = 0.0
         for inflow in self.inflows:
-            net_flow += inflow.rate
+            net_flow += self._rate_magnitude(inflow.rate, timestep)
         for outflow in self.outflows:
-            net_flow -= outflow.rate
-        self.value += net_flow * timestep
+            net_flow -= self._rate_magnitude(outflow.rate, timestep)
+        return net_flow
+
+    def _rate_magnitude(self, rate, timestep):
+        """
+        Returns the magnitude of a flow rate in the stock's unit per timestep unit.
+
+        :param rate: The flow rate (Quantity, or a number already in those units).
+        :param timestep: The time interval for the update.
+        :returns: The rate magnitude.
+        :rtype: float
+        """
+        if not isinstance(rate, Q_):
+            return rate
+        if not isinstance(self.value, Q_):
+            # A unitless stock has no unit to convert to; take the rate as is
+            return rate.magnitude
+        key = (rate.units, timestep.units, self.value.units)
+        factor = self._rate_factors.get(key)
+        if factor is None:
+            # Raises a DimensionalityError if the rate does not fit this stock
+            factor = (Q_(1.0, rate.units) * Q_(1.0, timestep.units)).m_as(self.value.units)
+            self._rate_factors[key] = factor
+        return rate.magnitude * factor
 
     def get_value(self):
         """
@@ -1,3 +1,19 @@
+from bisect import bisect_right
+
+import numpy as np
+
+
+def _as_float_array(values):
+    """
+    Returns `values` as a contiguous float64 array plus their unit. Quantity values are
+    converted to the unit of the first one; plain numbers have unit None.
+    """
+    unit = getattr(values[0], 'units', None)
+    if unit is not None:
+        values = [value.m_as(unit) for value in values]
+    return np.ascontiguousarray(values, dtype=np.float64), unit
+
+
 class Table:
     """
     A class for representing tabular data with linear interpolation between points.
@@ -31,6 +47,15 @@ class Table:
         self.x_values = [p[0] for p in points]
         self.y_values = [p[1] for p in points]
         self.name = name
+
+        # Float copies for lookup_batch, built on first use (see `_as_float_array`)
+        self._x_array = self._x_unit = None
+        self._y_array = self._y_unit = None
+
+        # Slope of each segment, computed once (zero-width segments get slope 0)
+        self._slopes = [(y1 - y0) / (x1 - x0) if x1 != x0 else 0.0
+                        for x0, x1, y0, y1 in zip(self.x_values, self.x_values[1:],
+                                                  self.y_values, self.y_values[1:])]
     
     def lookup(self, x):
         """
@@ -57,23 +82,54 @@ class Table:
         if x >= self.x_values[-1]:
             return self.y_values[-1]
         
-        # Find the two points to interpolate between
-        for i in range(len(self.x_values) - 1):
-            if self.x_values[i] <= x <= self.x_values[i + 1]:
-                # Linear interpolation formula
-                x0, y0 = self.x_values[i], self.y_values[i]
-                x1, y1 = self.x_values[i + 1], self.y_values[i + 1]
-                
-                # Avoid division by zero
-                if x1 == x0:
-                    return y0
-                
-                # Linear interpolation: y = y0 + (x - x0) * (y1 - y0) / (x1 - x0)
-                return y0 + (x - x0) * (y1 - y0) / (x1 - x0)
-        
-        # This should never happen if the code is correct
-        raise ValueError(f"Could not interpolate for x={x}")
+        # Binary search for the segment with x_values[i] <= x < x_values[i + 1]
+        i = bisect_right(self.x_values, x) - 1
+
+        # Linear interpolation with the precomputed slope (y1 - y0) / (x1 - x0)
+        return self.y_values[i] + (x - self.x_values[i]) * self._slopes[i]
     
+    def lookup_batch(self, x):
+        """
+        Look up y-values for an array of x-values using linear interpolation.
+
+        Values outside the table range are clamped to the first and last y-values,
+        as in `lookup`.
+
+        Parameters:
+        -----------
+        x : array-like
+            The x-values to look up
+
+        Returns:
+        --------
+        numpy.ndarray
+            The interpolated y-values (a Quantity array if the table's y-values
+            are Quantities)
+        """
+        x_array, y_array = self.x_array, self.y_array
+        if self._x_unit is not None and hasattr(x, 'm_as'):
+            x = x.m_as(self._x_unit)
+        y = np.interp(np.asarray(x, dtype=np.float64), x_array, y_array)
+        return y if self._y_unit is None else y * self._y_unit
+
+    @property
+    def x_array(self):
+        """
+        The x-values as a contiguous float64 array (magnitudes, for Quantity points).
+        """
+        if self._x_array is None:
+            self._x_array, self._x_unit = _as_float_array(self.x_values)
+        return self._x_array
+
+    @property
+    def y_array(self):
+        """
+        The y-values as a contiguous float64 array (magnitudes, for Quantity points).
+        """
+        if self._y_array is None:
+            self._y_array, self._y_unit = _as_float_array(self.y_values)
+        return self._y_array
+
     def __call__(self, x):
         """
         Allow the table to be called as a function.
@@ -21,6 +21,7 @@ class UnitManager:
         else:
             self.ureg = pint.UnitRegistry()
         self.Q_ = self.ureg.Quantity
+        self._parsed_units = {}
         self._initialized = True
 
 
@@ -32,6 +33,21 @@ class UnitManager:
         """
         self.ureg.define(definition)
 
+    def parse_unit(self, unit: str):
+        """
+        Parses a unit string into a pint Unit, caching the result.
+
+        Model components often repeat the same unit strings, and pint's parser is
+        slow, so each distinct string is parsed only once.
+
+        Example: parse_unit('people/day')
+        """
+        parsed = self._parsed_units.get(unit)
+        if parsed is None:
+            parsed = self.ureg.parse_expression(unit).units
+            self._parsed_units[unit] = parsed
+        return parsed
+
     def get_quantity(self, value, unit: str = None):
         """
         Wraps a value with a unit if provided.
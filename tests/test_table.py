@@ -0,0 +1,34 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pysydy'))
+
+from table import Table
+from units import units
+
+Q_ = units.Q_
+
+
+class TestTable(unittest.TestCase):
+
+    def test_lookup_interpolates(self):
+        table = Table([2, 0, 1], [0, 0, 10])
+        self.assertEqual(table(0.5), 5.0)
+        self.assertEqual(table(-1), 0)
+        self.assertEqual(table(3), 0)
+
+    def test_quantity_valued_table(self):
+        table = Table([0, 1, 2], [Q_(0, 'people'), Q_(10, 'people'), Q_(0, 'people')])
+        self.assertEqual(table.lookup(0.5), Q_(5.0, 'people'))
+        batch = table.lookup_batch([0.5, 1.5])
+        self.assertEqual(list(batch.m_as('people')), [5.0, 5.0])
+
+    def test_lookup_batch_matches_lookup(self):
+        table = Table([0, 1, 3], [1, 3, 0])
+        xs = [-1, 0.25, 1, 2, 4]
+        self.assertEqual(list(table.lookup_batch(xs)), [table(x) for x in xs])
+
+
+if __name__ == '__main__':
+    unittest.main()